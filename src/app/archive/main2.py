@@ -2,8 +2,11 @@ import cv2
 import mediapipe as mp
 import numpy as np
 import time
+import math
 import os
 import threading
+import multiprocessing
+from multiprocessing import shared_memory
 import queue
 from loguru import logger
 from src.utils.sound_generator import SoundGenerator
@@ -11,30 +14,430 @@ from src.utils.garageband_handler import GarageBandHandler
 import pandas as pd
 from datetime import datetime
 import pathlib
+import subprocess
 import matplotlib.pyplot as plt
-from matplotlib import animation
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from mpl_toolkits.mplot3d import Axes3D
+from mediapipe.framework.formats import landmark_pb2, classification_pb2
+from mediapipe.tasks.python import BaseOptions
+from mediapipe.tasks.python.vision import (
+    FaceLandmarker, FaceLandmarkerOptions,
+    HandLandmarker, HandLandmarkerOptions,
+    RunningMode
+)
+
+# 処理キューの長さと、共有メモリ上のフレームスロット数
+# キューには最新の1枚だけを置く。スロットはキュー待ち・処理中・結果キュー内・もう一方の結果待ちの4枚分
+FRAME_QUEUE_SIZE = 1
+FRAME_SLOTS = 4
+
+# ラジアンから度への変換係数
+_RAD2DEG = 180 / math.pi
+
+# 手の軌跡バッファの初期容量（足りなくなったら倍に拡張）
+HAND_TRAJECTORY_CAPACITY = 4096
+HAND_TRAJECTORY_FIELDS = ('timestamp', 'x', 'y', 'z')
+
+# 3Dアニメーションの最大フレーム数（20fpsで60秒分、超える場合は間引く）
+MAX_ANIMATION_FRAMES = 1200
+
+def _to_landmark_list(landmarks):
+    """
+    Tasks APIのランドマークを描画・後段処理用のNormalizedLandmarkListに変換
+    """
+    return landmark_pb2.NormalizedLandmarkList(landmark=[
+        landmark_pb2.NormalizedLandmark(x=lm.x, y=lm.y, z=lm.z)
+        for lm in landmarks
+    ])
+
+def _landmarks_to_array(landmarks):
+    """
+    ランドマーク列を (N, 3) のfloat32配列 (x, y, z) に一括変換
+    """
+    return np.array([(lm.x, lm.y, lm.z) for lm in landmarks], dtype=np.float32)
+
+def _judge_palm_up(landmarks, handedness):
+    """
+    人差し指の先(8)と小指の先(20)の左右関係から、手のひらが上向きかどうかを判定
+    （src/utils/hand_processor.pyのjudge_palm_upと同じ判定）
+    """
+    index_x, pinky_x = landmarks[[8, 20], 0].tolist()
+    return index_x < pinky_x if handedness == "Left" else index_x > pinky_x
+
+def _to_classification_list(categories):
+    """
+    Tasks APIの左右判定結果をClassificationListに変換
+    """
+    return classification_pb2.ClassificationList(classification=[
+        classification_pb2.Classification(index=c.index, score=c.score, label=c.category_name)
+        for c in categories
+    ])
+
+def _acquire_free_slot(frame_queue, pending):
+    """
+    キューに残っている古いフレームを破棄し、空いている共有メモリのスロットを返す
+    処理待ち・処理中のフレームが使っているスロットは避ける
+
+    Returns:
+        int | None: スロット番号（空きがなければNone）
+    """
+    try:
+        stale_index, _ = frame_queue.get_nowait()
+        pending.pop(stale_index, None)
+    except queue.Empty:
+        pass
+    
+    used_slots = {slot for _, slot, _ in pending.values()}
+    for slot in range(FRAME_SLOTS):
+        if slot not in used_slots:
+            return slot
+    return None
+
+def _retrieve_to_slot(capture, frame_queue, slots, pending):
+    """
+    grab()済みのフレームを共有メモリの空きスロットへ直接retrieveする
+    空きスロットがない場合は通常どおりretrieveし、推論には回さない
+
+    Returns:
+        tuple: (取得できたか, 左右反転前のフレーム, スロット番号 or None)
+    """
+    slot = _acquire_free_slot(frame_queue, pending)
+    if slot is None:
+        ret, frame = capture.retrieve()
+        return ret, frame, None
+    
+    ret, frame = capture.retrieve(slots[slot])
+    if ret and not np.shares_memory(frame, slots[slot]):
+        # バックエンドが別のバッファを返した場合のみコピー
+        np.copyto(slots[slot], frame)
+    return ret, frame, slot
+
+def _submit_frame(frame_queue, pending, frame_index, frame, slot, timestamp):
+    """
+    スロットに書き込み済みのフレームを処理キューに追加
+    frameは結果が返ってきたときに描画する左右反転済みのフレーム
+    timestampはそのフレームを取り込んだ時刻
+
+    Returns:
+        bool: キューに追加できたかどうか
+    """
+    pending[frame_index] = (frame, slot, timestamp)
+    try:
+        frame_queue.put_nowait((frame_index, slot))
+    except queue.Full:
+        del pending[frame_index]
+        return False
+    return True
+
+def _put_latest(q, item):
+    """
+    サイズ1のキューに最新の項目だけを置く（未処理の古い項目は破棄）
+    """
+    try:
+        q.get_nowait()
+    except queue.Empty:
+        pass
+    try:
+        q.put_nowait(item)
+    except queue.Full:
+        pass
+
+def _take_pending_frame(pending, frame_index):
+    """
+    処理結果に対応する元フレームと取り込み時刻を取り出す
+    それより古い取りこぼしたフレームは破棄
+    """
+    for stale_index in [i for i in pending if i < frame_index]:
+        del pending[stale_index]
+    frame, _, timestamp = pending.pop(frame_index)
+    return frame, timestamp
+
+class _WorkerStopped(Exception):
+    """
+    MediaPipe処理プロセスが停止した
+    """
+
+def _poll_result(result_queue, process):
+    """
+    結果キューから待たずに1件取り出す（まだ届いていなければNone）
+    処理プロセスが終了を知らせてきた場合や、異常終了していた場合は_WorkerStoppedを送出する
+    """
+    try:
+        item = result_queue.get_nowait()
+    except queue.Empty:
+        if not process.is_alive():
+            raise _WorkerStopped()
+        return None
+    if item is None:
+        raise _WorkerStopped()
+    return item
+
+def _create_landmarker(landmarker_class, options_class, model_path, use_gpu, **options):
+    """
+    MediaPipe Tasks APIのランドマーカーを作成
+    use_gpuが有効ならGPUデリゲートで作成し、失敗した場合はCPUで作り直す
+    """
+    if use_gpu:
+        try:
+            return landmarker_class.create_from_options(options_class(
+                base_options=BaseOptions(model_asset_path=model_path,
+                                         delegate=BaseOptions.Delegate.GPU),
+                **options
+            ))
+        except Exception as e:
+            logger.warning(f"GPUデリゲートを使えないため、CPUで推論します: {e}")
+    
+    return landmarker_class.create_from_options(options_class(
+        base_options=BaseOptions(model_asset_path=model_path,
+                                 delegate=BaseOptions.Delegate.CPU),
+        **options
+    ))
+
+def _process_face_frames(shm_name, frame_shape, frame_queue, result_queue,
+                         model_path, use_gpu):
+    """
+    別プロセスで顔のMediaPipe処理を実行
+    フレームは共有メモリから読み出し、キューではスロット番号のみを受け取る
+    Noneを受け取ったら終了し、結果キューにもNoneを流して終了を知らせる
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    slots = np.ndarray((FRAME_SLOTS, *frame_shape), np.uint8, buffer=shm.buf)
+    # 反転・色変換の出力先は使い回す
+    mirror_buf = np.empty(frame_shape, np.uint8)
+    rgb_buf = np.empty(frame_shape, np.uint8)
+    try:
+        face_landmarker = _create_landmarker(
+            FaceLandmarker, FaceLandmarkerOptions, model_path, use_gpu,
+            running_mode=RunningMode.VIDEO,
+            num_faces=1,
+            min_face_detection_confidence=0.5,
+            min_tracking_confidence=0.5
+        )
+        with face_landmarker:
+            last_timestamp_ms = -1
+            while True:
+                item = frame_queue.get()
+                if item is None:
+                    break
+                
+                frame_index, slot = item
+                try:
+                    frame = slots[slot]
+                    # スロットには反転前のフレームが入っているので、ここで左右反転する
+                    mirrored = cv2.flip(frame, 1, dst=mirror_buf)
+                    image_rgb = cv2.cvtColor(mirrored, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+                    mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=image_rgb)
+                    
+                    # VIDEOモードではタイムスタンプが単調増加である必要がある
+                    timestamp_ms = max(time.monotonic_ns() // 1_000_000, last_timestamp_ms + 1)
+                    last_timestamp_ms = timestamp_ms
+                    face_results = face_landmarker.detect_for_video(mp_image, timestamp_ms)
+                    
+                    # 顔は描画しないので、向きの計算に使う配列だけを返す
+                    results = {
+                        'face_landmark_arrays': [
+                            _landmarks_to_array(landmarks)
+                            for landmarks in face_results.face_landmarks
+                        ] if face_results.face_landmarks else None
+                    }
+                    
+                except Exception as e:
+                    logger.exception("顔フレーム処理中にエラーが発生")
+                    results = {'face_landmark_arrays': None}
+                
+                # 1フレームにつき必ず1つ結果を返す（メインループは結果を待ってブロックするため）
+                result_queue.put((results, frame_index))
+                    
+    except Exception as e:
+        logger.exception("顔MediaPipe処理プロセスでエラーが発生")
+    finally:
+        try:
+            result_queue.put(None, timeout=1.0)
+        except queue.Full:
+            pass
+        frame = None
+        slots = None
+        shm.close()
+        logger.info("顔MediaPipe処理プロセスを終了します")
+
+def _process_hand_frames(shm_name, frame_shape, frame_queue, result_queue,
+                         model_path, use_gpu):
+    """
+    別プロセスで手のMediaPipe処理を実行
+    フレームは共有メモリから読み出し、キューではスロット番号のみを受け取る
+    Noneを受け取ったら終了し、結果キューにもNoneを流して終了を知らせる
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    slots = np.ndarray((FRAME_SLOTS, *frame_shape), np.uint8, buffer=shm.buf)
+    # 反転・色変換の出力先は使い回す
+    mirror_buf = np.empty(frame_shape, np.uint8)
+    rgb_buf = np.empty(frame_shape, np.uint8)
+    try:
+        hand_landmarker = _create_landmarker(
+            HandLandmarker, HandLandmarkerOptions, model_path, use_gpu,
+            running_mode=RunningMode.VIDEO,
+            num_hands=2,
+            min_hand_detection_confidence=0.5
+        )
+        with hand_landmarker:
+            last_timestamp_ms = -1
+            while True:
+                item = frame_queue.get()
+                if item is None:
+                    break
+                
+                frame_index, slot = item
+                try:
+                    frame = slots[slot]
+                    # スロットには反転前のフレームが入っているので、ここで左右反転する
+                    mirrored = cv2.flip(frame, 1, dst=mirror_buf)
+                    image_rgb = cv2.cvtColor(mirrored, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+                    mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=image_rgb)
+                    
+                    # VIDEOモードではタイムスタンプが単調増加である必要がある
+                    timestamp_ms = max(time.monotonic_ns() // 1_000_000, last_timestamp_ms + 1)
+                    last_timestamp_ms = timestamp_ms
+                    hands_results = hand_landmarker.detect_for_video(mp_image, timestamp_ms)
+                    
+                    # 描画用のNormalizedLandmarkListと、座標計算用の配列の両方を返す
+                    results = {
+                        'multi_hand_landmarks': [
+                            _to_landmark_list(landmarks)
+                            for landmarks in hands_results.hand_landmarks
+                        ],
+                        'hand_landmark_arrays': [
+                            _landmarks_to_array(landmarks)
+                            for landmarks in hands_results.hand_landmarks
+                        ],
+                        'handedness': [
+                            _to_classification_list(categories)
+                            for categories in hands_results.handedness
+                        ] or None
+                    }
+                    
+                except Exception as e:
+                    logger.exception("手フレーム処理中にエラーが発生")
+                    results = {'multi_hand_landmarks': [], 'hand_landmark_arrays': [], 'handedness': None}
+                
+                # 1フレームにつき必ず1つ結果を返す（メインループは結果を待ってブロックするため）
+                result_queue.put((results, frame_index))
+                    
+    except Exception as e:
+        logger.exception("手MediaPipe処理プロセスでエラーが発生")
+    finally:
+        try:
+            result_queue.put(None, timeout=1.0)
+        except queue.Full:
+            pass
+        frame = None
+        slots = None
+        shm.close()
+        logger.info("手MediaPipe処理プロセスを終了します")
+
+def _render_3d_trajectory_animation(x_coords, y_coords, z_coords, animation_path):
+    """
+    手の軌跡の3Dアニメーションを描画してmp4に保存
+    Aggで描画したRGBAバッファをそのままffmpegの標準入力に流し込む
+    """
+    try:
+        # 3Dプロットの設定（pyplotを使わずAggキャンバスに直接描画）
+        fig = Figure(figsize=(12, 8), dpi=100)
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111, projection='3d')
+
+        # プロット用のラインとポイントを作成
+        line = ax.plot([], [], [], 
+                    c='blue',
+                    alpha=0.5,
+                    linewidth=2)[0]
+        point = ax.plot([], [], [],
+                    'o',
+                    c='red',
+                    markersize=8)[0]
+
+        margin = 0.1
+        ax.set_xlim([x_coords.min() - margin, x_coords.max() + margin])
+        ax.set_ylim([y_coords.min() - margin, y_coords.max() + margin])
+        ax.set_zlim([z_coords.min() - margin, z_coords.max() + margin])
+        
+        ax.set_xlabel('X')
+        ax.set_ylabel('Y')
+        ax.set_zlabel('Z')
+        ax.set_title('Hand Trajectory (3D)')
+        ax.grid(True)
+        
+        trail_length = 30
+        
+        # 長いセッションは間引いて描画する
+        num_samples = len(x_coords)
+        stride = max(1, -(-num_samples // MAX_ANIMATION_FRAMES))
+        end_indices = list(range(stride, num_samples, stride)) + [num_samples]
+
+        width, height = canvas.get_width_height()
+        ffmpeg = subprocess.Popen(
+            ['ffmpeg', '-y', '-loglevel', 'error',
+             '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{width}x{height}', '-r', '20',
+             '-i', '-',
+             '-vcodec', 'h264', '-pix_fmt', 'yuv420p', '-b:v', '5000k',
+             '-metadata', 'artist=HandTracker',
+             animation_path],
+            stdin=subprocess.PIPE
+        )
+        try:
+            for frame, end_idx in enumerate(end_indices):
+                ax.view_init(elev=20, azim=frame)
+                start_idx = max(0, end_idx - trail_length)
+                
+                # 軌跡の更新
+                line.set_data(x_coords[start_idx:end_idx],
+                            y_coords[start_idx:end_idx])
+                line.set_3d_properties(z_coords[start_idx:end_idx])
+                
+                # 現在位置の点の更新
+                point.set_data([x_coords[end_idx-1]], 
+                            [y_coords[end_idx-1]])
+                point.set_3d_properties([z_coords[end_idx-1]])
+                
+                canvas.draw()
+                ffmpeg.stdin.write(canvas.buffer_rgba())
+        finally:
+            ffmpeg.stdin.close()
+            ffmpeg.wait()
+        
+        logger.info(f"3Dアニメーションを保存しました: {animation_path}")
+    except Exception as e:
+        logger.error(f"3Dアニメーション作成中にエラー: {e}")
 
 class DualCameraHandFaceSoundTracker:
-    def __init__(self, face_camera_no: int = 0, hand_camera_no: int = 1, width: int = 640, height: int = 360):
+    def __init__(self, face_camera_no: int = 0, hand_camera_no: int = 1, width: int = 640, height: int = 360,
+                 face_model_path: str = "models/face_landmarker.task",
+                 hand_model_path: str = "models/hand_landmarker.task",
+                 use_gpu: bool = False):
         """
         2台のカメラを使用する手のランドマーク、顔の向き追跡、音生成アプリケーションの初期化
+        use_gpuを有効にするとGPUデリゲートで推論する（使えない場合はCPUで推論）
+        
+        モデル（.task）はリポジトリに含まれていないので、READMEの手順でmodels/に置いておく
         """
+        for model_path in [face_model_path, hand_model_path]:
+            if not os.path.exists(model_path):
+                raise FileNotFoundError(
+                    f"モデルファイルが見つかりません: {model_path}（READMEの「モデルの配置」を参照）")
         os.environ['no_proxy'] = "*"
         
-        # スレッド間通信用のキュー
-        self.face_frame_queue = queue.Queue(maxsize=10)
-        self.hand_frame_queue = queue.Queue(maxsize=10)
-        self.face_result_queue = queue.Queue(maxsize=10)
-        self.hand_result_queue = queue.Queue(maxsize=10)
-        self.running = threading.Event()
+        # プロセス間通信用のキュー（フレーム本体は共有メモリ、キューにはスロット番号のみ）
+        self.face_frame_queue = multiprocessing.Queue(maxsize=FRAME_QUEUE_SIZE)
+        self.hand_frame_queue = multiprocessing.Queue(maxsize=FRAME_QUEUE_SIZE)
+        self.face_result_queue = multiprocessing.Queue(maxsize=1)
+        self.hand_result_queue = multiprocessing.Queue(maxsize=1)
+        self.running = multiprocessing.Event()
         self.running.set()
         
         # MediaPipe設定
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
         self.mp_hands = mp.solutions.hands
-        self.mp_face_mesh = mp.solutions.face_mesh
         
         # カメラ設定
         self.face_capture = cv2.VideoCapture(face_camera_no)
@@ -43,12 +446,33 @@ class DualCameraHandFaceSoundTracker:
         for capture in [self.face_capture, self.hand_capture]:
             capture.set(cv2.CAP_PROP_FRAME_WIDTH, width)
             capture.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            # ドライバ側に古いフレームを溜めない
+            capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
         
         # 動画保存の設定
         self.frame_width = width
         self.frame_height = height
         self.fps = 20.0
         
+        # フレーム受け渡し用の共有メモリ（カメラ側で解像度が調整される場合があるので実際の値を使う）
+        face_frame_shape = (int(self.face_capture.get(cv2.CAP_PROP_FRAME_HEIGHT)) or height,
+                            int(self.face_capture.get(cv2.CAP_PROP_FRAME_WIDTH)) or width, 3)
+        hand_frame_shape = (int(self.hand_capture.get(cv2.CAP_PROP_FRAME_HEIGHT)) or height,
+                            int(self.hand_capture.get(cv2.CAP_PROP_FRAME_WIDTH)) or width, 3)
+        self._face_shm = shared_memory.SharedMemory(
+            create=True, size=FRAME_SLOTS * int(np.prod(face_frame_shape)))
+        self._hand_shm = shared_memory.SharedMemory(
+            create=True, size=FRAME_SLOTS * int(np.prod(hand_frame_shape)))
+        self._face_slots = np.ndarray((FRAME_SLOTS, *face_frame_shape), np.uint8,
+                                      buffer=self._face_shm.buf)
+        self._hand_slots = np.ndarray((FRAME_SLOTS, *hand_frame_shape), np.uint8,
+                                      buffer=self._hand_shm.buf)
+        
+        # フレーム番号と、処理待ちフレームごとの (描画用の元フレーム, スロット)
+        self._frame_index = 0
+        self._face_pending = {}
+        self._hand_pending = {}
+        
         # 音ジェネレーター設定
         try:
             output_names = SoundGenerator.get_output_names()
@@ -59,6 +483,7 @@ class DualCameraHandFaceSoundTracker:
         
         # データ保存用の設定
         self.face_orientation_data = []
+        # 手ごとに {'timestamp', 'x', 'y', 'z': 事前確保した配列, 'count': 記録数}
         self.hand_trajectory_data = {}
         
         # セッション設定
@@ -84,188 +509,158 @@ class DualCameraHandFaceSoundTracker:
             (self.frame_width, 480)
         )
         
-        # 処理スレッド初期化
-        self.face_process_thread = threading.Thread(target=self._process_face_frames)
-        self.hand_process_thread = threading.Thread(target=self._process_hand_frames)
-        self.face_process_thread.daemon = True
-        self.hand_process_thread.daemon = True
+        # 動画の書き込みは別スレッドで行い、エンコード待ちでメインループを止めない
+        self.video_write_queue = queue.Queue(maxsize=32)
+        self.video_write_thread = threading.Thread(target=self._write_video_frames)
+        self.video_write_thread.daemon = True
+        
+        # ランドマークの描画は別スレッドで行い、取り込み・推論のループと切り離す
+        # 描画が追いつかない場合は最新のフレームだけを描画する
+        self.draw_queue = queue.Queue(maxsize=1)
+        self.display_queue = queue.Queue(maxsize=1)
+        self.draw_thread = threading.Thread(target=self._draw_frames)
+        self.draw_thread.daemon = True
+        
+        # 処理プロセス初期化（デリゲートはuse_gpuで切り替え、GPUが使えなければCPU）
+        self.face_process = multiprocessing.Process(
+            target=_process_face_frames,
+            args=(self._face_shm.name, face_frame_shape, self.face_frame_queue,
+                  self.face_result_queue, face_model_path, use_gpu),
+            daemon=True
+        )
+        self.hand_process = multiprocessing.Process(
+            target=_process_hand_frames,
+            args=(self._hand_shm.name, hand_frame_shape, self.hand_frame_queue,
+                  self.hand_result_queue, hand_model_path, use_gpu),
+            daemon=True
+        )
         
         logger.info(f"セッションディレクトリを作成しました: {self.session_dir}")
 
-    def _process_face_frames(self):
-        """
-        別スレッドで顔のMediaPipe処理を実行
-        """
-        try:
-            with self.mp_face_mesh.FaceMesh(
-                static_image_mode=False,
-                max_num_faces=1,
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5
-            ) as face_mesh:
-                while self.running.is_set():
-                    try:
-                        frame = self.face_frame_queue.get(timeout=1.0)
-                        if frame is None:
-                            continue
-                        
-                        frame_copy = frame.copy()
-                        image_rgb = cv2.cvtColor(frame_copy, cv2.COLOR_BGR2RGB)
-                        face_results = face_mesh.process(image_rgb)
-                        
-                        results = {
-                            'multi_face_landmarks': [
-                                landmark.copy() if hasattr(landmark, 'copy') 
-                                else landmark 
-                                for landmark in (face_results.multi_face_landmarks or [])
-                            ] if face_results.multi_face_landmarks else None
-                        }
-                        
-                        self.face_result_queue.put((results, frame_copy))
-                        
-                    except queue.Empty:
-                        continue
-                    except Exception as e:
-                        logger.exception("顔フレーム処理中にエラーが発生")
-                        continue
-                        
-        except Exception as e:
-            logger.exception("顔MediaPipe処理スレッドでエラーが発生")
-        finally:
-            logger.info("顔MediaPipe処理スレッドを終了します")
-
-    def _process_hand_frames(self):
-        """
-        別スレッドで手のMediaPipe処理を実行
-        """
-        try:
-            with self.mp_hands.Hands(
-                static_image_mode=False,
-                max_num_hands=2,
-                min_detection_confidence=0.5
-            ) as hands:
-                while self.running.is_set():
-                    try:
-                        frame = self.hand_frame_queue.get(timeout=1.0)
-                        if frame is None:
-                            continue
-                        
-                        frame_copy = frame.copy()
-                        image_rgb = cv2.cvtColor(frame_copy, cv2.COLOR_BGR2RGB)
-                        hands_results = hands.process(image_rgb)
-                        
-                        results = {
-                            'multi_hand_landmarks': [
-                                landmark.copy() if hasattr(landmark, 'copy') 
-                                else landmark 
-                                for landmark in (hands_results.multi_hand_landmarks or [])
-                            ],
-                            'handedness': hands_results.multi_handedness
-                        }
-                        
-                        self.hand_result_queue.put((results, frame_copy))
-                        
-                    except queue.Empty:
-                        continue
-                    except Exception as e:
-                        logger.exception("手フレーム処理中にエラーが発生")
-                        continue
-                        
-        except Exception as e:
-            logger.exception("手MediaPipe処理スレッドでエラーが発生")
-        finally:
-            logger.info("手MediaPipe処理スレッドを終了します")
-
     def run(self):
         """
         メインアプリケーションループ
         """
         cv2.startWindowThread()
         try:
-            # 処理スレッドを開始
-            self.face_process_thread.start()
-            self.hand_process_thread.start()
+            # 処理プロセスと動画書き込みスレッドを開始
+            self.face_process.start()
+            self.hand_process.start()
+            self.video_write_thread.start()
+            self.draw_thread.start()
             
-            while (self.face_capture.isOpened() and 
+            # 最初のフレームを取り込む
+            # 2台のカメラはgrab()を続けて呼び、撮影タイミングをそろえる
+            # フレーム単位のタイムスタンプは取り込み時の単調時計（時刻補正の影響を受けない）
+            frame_ts = time.monotonic()
+            grabbed = self.face_capture.grab() and self.hand_capture.grab()
+            face_item = hand_item = None
+            
+            while (grabbed and
+                   self.face_capture.isOpened() and 
                    self.hand_capture.isOpened() and 
                    self.running.is_set()):
                 
-                # 顔カメラからフレームを取得
-                face_ret, face_frame = self.face_capture.read()
+                # 取り込み済みのフレームを共有メモリの空きスロットへ直接取得
+                # （キューに残っている古いフレームは破棄し、常に最新のフレームを処理させる）
+                face_ret, face_raw, face_slot = _retrieve_to_slot(
+                    self.face_capture, self.face_frame_queue, self._face_slots, self._face_pending)
                 if not face_ret:
                     break
-                face_frame = cv2.flip(face_frame, 1)
-                
-                # 手カメラからフレームを取得
-                hand_ret, hand_frame = self.hand_capture.read()
+                hand_ret, hand_raw, hand_slot = _retrieve_to_slot(
+                    self.hand_capture, self.hand_frame_queue, self._hand_slots, self._hand_pending)
                 if not hand_ret:
                     break
-                hand_frame = cv2.flip(hand_frame, 1)
+                current_ts = frame_ts
                 
-                # フレームを処理キューに追加
-                try:
-                    self.face_frame_queue.put(face_frame.copy(), timeout=0.1)
-                    self.hand_frame_queue.put(hand_frame.copy(), timeout=0.1)
-                except queue.Full:
-                    continue
+                # 描画・表示用の左右反転
+                # （推論側もスロットの反転前フレームをワーカー内で全解像度のまま反転するので、
+                #   反転はカメラごとに2回。スロットは描画中に再利用されるため、1枚を共有はできない）
+                face_frame = cv2.flip(face_raw, 1)
+                hand_frame = cv2.flip(hand_raw, 1)
+                
+                # 処理キューに追加
+                if face_slot is not None:
+                    _submit_frame(self.face_frame_queue, self._face_pending,
+                                  self._frame_index, face_frame, face_slot, current_ts)
+                if hand_slot is not None:
+                    _submit_frame(self.hand_frame_queue, self._hand_pending,
+                                  self._frame_index, hand_frame, hand_slot, current_ts)
+                self._frame_index += 1
+                
+                # 推論の完了を待つ間に次のフレームを取り込んでおく
+                frame_ts = time.monotonic()
+                grabbed = self.face_capture.grab() and self.hand_capture.grab()
                 
-                # 処理結果を取得
+                # 処理結果を待たずに取得する（届いていなければ次のフレームの取り込みに進む）
+                # 顔と手の結果がそろったら、その組をまとめて処理する
                 try:
-                    face_results, processed_face_frame = self.face_result_queue.get(timeout=0.1)
-                    hand_results, processed_hand_frame = self.hand_result_queue.get(timeout=0.1)
-                except queue.Empty:
-                    continue
+                    if face_item is None:
+                        face_item = _poll_result(self.face_result_queue, self.face_process)
+                    if hand_item is None:
+                        hand_item = _poll_result(self.hand_result_queue, self.hand_process)
+                except _WorkerStopped:
+                    logger.error("MediaPipe処理プロセスが停止しました")
+                    break
                 
-                face_image = processed_face_frame.copy()
-                hand_image = processed_hand_frame.copy()
-
-                # 手のランドマーク処理
-                if hand_results['multi_hand_landmarks']:
-                    for i, landmarks in enumerate(hand_results['multi_hand_landmarks']):
-                        try:
-                            self.mp_drawing.draw_landmarks(
-                                hand_image,
-                                landmarks,
-                                self.mp_hands.HAND_CONNECTIONS,
-                                self.mp_drawing_styles.get_default_hand_landmarks_style(),
-                                self.mp_drawing_styles.get_default_hand_connections_style()
-                            )
-                            
-                            self._process_hand_data(landmarks, i)
-                            
-                            if i == 0:
-                                hand_x = landmarks.landmark[9].x
-                                hand_y = landmarks.landmark[9].y
-                                handedness = hand_results['handedness'][0].classification[0].label
-                                
-                                self.sound_generator.update_hand_orientation(landmarks, handedness)
-                                
-                                new_notes = self.sound_generator.new_notes(hand_x, hand_y)
-                                self.sound_generator.update_notes(new_notes)
+                if face_item is not None and hand_item is not None:
+                    face_results, face_index = face_item
+                    hand_results, hand_index = hand_item
+                    face_item = hand_item = None
+                    
+                    face_image, face_ts = _take_pending_frame(self._face_pending, face_index)
+                    hand_image, hand_ts = _take_pending_frame(self._hand_pending, hand_index)
+                    
+                    # 手のランドマーク処理（手が検出されなければ手のひらは上向きでない扱い）
+                    is_palm_up = False
+                    if hand_results['multi_hand_landmarks']:
+                        for i, (landmarks, landmark_array) in enumerate(zip(
+                                hand_results['multi_hand_landmarks'],
+                                hand_results['hand_landmark_arrays'])):
+                            try:
+                                self._process_hand_data(landmark_array, i, hand_ts)
                             
-                            is_palm_up = self.sound_generator.is_palm_up
-                            cv2.putText(hand_image, f'Palm up: {is_palm_up}', 
-                                      (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+                                if i == 0:
+                                    (hand_x, hand_y), (wrist_x, wrist_y) = landmark_array[[9, 0], :2].tolist()
+                                    handedness = hand_results['handedness'][0].classification[0].label
+                                    is_palm_up = _judge_palm_up(landmark_array, handedness)
+                                    
+                                    # 手首から中指の付け根までの距離を奥行きの目安にする
+                                    hand_z = max(0.0, math.hypot(hand_x - wrist_x, hand_y - wrist_y) - 0.18) * 2
+                                    
+                                    new_notes = self.sound_generator.new_notes(hand_x, hand_y, hand_z, is_palm_up)
+                                    self.sound_generator.update_notes(new_notes)
                 
-                        except Exception as e:
-                            logger.error(f"ハンドランドマーク処理中のエラー: {e}")
-                            continue
+                            except Exception as e:
+                                logger.error(f"ハンドランドマーク処理中のエラー: {e}")
+                                continue
                 
-                # 顔の向き処理
-                if face_results['multi_face_landmarks']:
-                    try:
-                        face_landmarks = face_results['multi_face_landmarks'][0]
-                        yaw, pitch, roll = self._calculate_face_orientation(face_landmarks)
-                        self.face_orientation_data.append([time.time(), yaw, pitch, roll])
+                    # 顔の向き処理
+                    if face_results['face_landmark_arrays']:
+                        try:
+                            face_landmarks = face_results['face_landmark_arrays'][0]
+                            yaw, pitch, roll = self._calculate_face_orientation(face_landmarks)
+                            self.face_orientation_data.append([face_ts, yaw, pitch, roll])
                         
-                    except Exception as e:
-                        logger.error(f"顔の向き処理中のエラー: {e}")
+                        except Exception as e:
+                            logger.error(f"顔の向き処理中のエラー: {e}")
                 
+                    # 描画・録画は描画スレッドに任せる
+                    _put_latest(self.draw_queue, (
+                        face_image,
+                        hand_image,
+                        hand_results['multi_hand_landmarks'],
+                        is_palm_up
+                    ))
+                
+                # 描画済みのフレームがあれば表示
+                # （HighGUIはmacOSではメインスレッドからしか呼べないため、表示はここで行う）
                 try:
-                    self.hand_video_writer.write(hand_image)
-                    self.face_video_writer.write(face_image)
-                    cv2.imshow('Face Tracking', face_image)
-                    cv2.imshow('Hand Tracking', hand_image)
+                    face_display, hand_display = self.display_queue.get_nowait()
+                    cv2.imshow('Face Tracking', face_display)
+                    cv2.imshow('Hand Tracking', hand_display)
+                except queue.Empty:
+                    pass
                 except Exception as e:
                     logger.error(f"画像表示/保存中のエラー: {e}")
                 
@@ -288,13 +683,37 @@ class DualCameraHandFaceSoundTracker:
                     except queue.Empty:
                         break
             
-            self.face_process_thread.join(timeout=2.0)
-            self.hand_process_thread.join(timeout=2.0)
+            # 処理プロセスに終了を通知
+            for q in [self.face_frame_queue, self.hand_frame_queue]:
+                try:
+                    q.put(None, timeout=1.0)
+                except queue.Full:
+                    pass
+            
+            for process in [self.face_process, self.hand_process]:
+                if process.is_alive():
+                    process.join(timeout=2.0)
+                if process.is_alive():
+                    process.terminate()
+            
+            # 共有メモリの解放
+            self._face_slots = None
+            self._hand_slots = None
+            for shm in [self._face_shm, self._hand_shm]:
+                shm.close()
+                shm.unlink()
             self._save_data()
             self._create_face_orientation_plots()
-            self._create_3d_trajectory_animation()
             self.sound_generator.end()
             
+            # 描画スレッドを止めてから、書き込み待ちのフレームを書き終えてライターを解放
+            if self.draw_thread.is_alive():
+                _put_latest(self.draw_queue, None)
+                self.draw_thread.join()
+            if self.video_write_thread.is_alive():
+                self.video_write_queue.put(None)
+                self.video_write_thread.join()
+            
             # OpenCVリソースの解放
             if self.face_video_writer is not None:
                 self.face_video_writer.release()
@@ -308,12 +727,72 @@ class DualCameraHandFaceSoundTracker:
             cv2.waitKey(1)
             cv2.destroyAllWindows()
             
+            # ウィンドウとカメラを閉じてから、時間のかかるアニメーション作成を開始
+            self._create_3d_trajectory_animation()
+            
             logger.info("アプリケーションを終了しました")
             
+    def _draw_frames(self):
+        """
+        別スレッドでランドマークの描画を行い、録画と表示に回す
+        """
+        while True:
+            item = self.draw_queue.get()
+            if item is None:
+                break
+            
+            face_image, hand_image, hand_landmarks, is_palm_up = item
+            try:
+                for landmarks in hand_landmarks:
+                    self.mp_drawing.draw_landmarks(
+                        hand_image,
+                        landmarks,
+                        self.mp_hands.HAND_CONNECTIONS,
+                        self.mp_drawing_styles.get_default_hand_landmarks_style(),
+                        self.mp_drawing_styles.get_default_hand_connections_style()
+                    )
+                if hand_landmarks:
+                    cv2.putText(hand_image, f'Palm up: {is_palm_up}', 
+                              (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+            except Exception as e:
+                logger.error(f"ランドマーク描画中のエラー: {e}")
+            
+            # 書き込みが追いつかない場合はフレームを落とす（描画は止めない）
+            # 2つの動画がずれないよう、同じ反復のフレームはまとめて渡す
+            try:
+                self.video_write_queue.put_nowait((
+                    (self.hand_video_writer, hand_image),
+                    (self.face_video_writer, face_image)
+                ))
+            except queue.Full:
+                pass
+            
+            _put_latest(self.display_queue, (face_image, hand_image))
+        logger.info("描画スレッドを終了します")
+    
+    def _write_video_frames(self):
+        """
+        別スレッドで動画ファイルへの書き込みを実行
+        """
+        while True:
+            item = self.video_write_queue.get()
+            if item is None:
+                break
+            
+            try:
+                for writer, image in item:
+                    writer.write(image)
+            except Exception as e:
+                logger.error(f"動画書き込み中のエラー: {e}")
+        logger.info("動画書き込みスレッドを終了します")
+            
     def _calculate_face_orientation(self, landmarks):
             """
             顔の向き（yaw, pitch, roll）を計算
             
+            Args:
+                landmarks: 顔ランドマークの (N, 3) 配列
+            
             Returns:
                 tuple: (yaw, pitch, roll) in degrees
                 - yaw: 左右の回転角度 (-: 左, +: 右)
@@ -322,28 +801,24 @@ class DualCameraHandFaceSoundTracker:
             """
             try:
                 # 必要なランドマークのインデックス
-                # 鼻先
-                nose_tip = landmarks.landmark[4]
-                # 両目の外側と内側のポイント
-                left_eye_outer = landmarks.landmark[33]
-                left_eye_inner = landmarks.landmark[133]
-                right_eye_inner = landmarks.landmark[362]
-                right_eye_outer = landmarks.landmark[263]
+                # 鼻先(4)、左目の外側(33)、右目の外側(263)のx, yをまとめて取り出す
+                (nose_x, nose_y), (left_x, left_y), (right_x, right_y) = \
+                    landmarks[[4, 33, 263], :2].tolist()
                 
                 # Yawの計算 (左右の回転)
-                eye_center_x = (left_eye_outer.x + right_eye_outer.x) / 2
-                eye_distance = abs(left_eye_outer.x - right_eye_outer.x)
-                yaw = np.arctan2(nose_tip.x - eye_center_x, eye_distance) * 180 / np.pi
+                eye_center_x = (left_x + right_x) / 2
+                eye_distance = abs(left_x - right_x)
+                yaw = math.atan2(nose_x - eye_center_x, eye_distance) * _RAD2DEG
                 
                 # Pitchの計算 (上下の回転)
-                eye_center_y = (left_eye_outer.y + right_eye_outer.y) / 2
-                pitch = np.arctan2(nose_tip.y - eye_center_y, eye_distance) * 180 / np.pi
+                eye_center_y = (left_y + right_y) / 2
+                pitch = math.atan2(nose_y - eye_center_y, eye_distance) * _RAD2DEG
                 
                 # Rollの計算 (首の傾き)
                 # 両目の傾きから計算
-                dy = right_eye_outer.y - left_eye_outer.y
-                dx = right_eye_outer.x - left_eye_outer.x
-                roll = np.arctan2(dy, dx) * 180 / np.pi
+                dy = right_y - left_y
+                dx = right_x - left_x
+                roll = math.atan2(dy, dx) * _RAD2DEG
                 
                 return yaw, pitch, roll
                 
@@ -351,26 +826,35 @@ class DualCameraHandFaceSoundTracker:
                 logger.error(f"顔の向き計算中にエラー: {e}")
                 return 0, 0, 0
 
-    def _process_hand_data(self, landmarks, hand_id):
+    def _process_hand_data(self, landmarks, hand_id, timestamp):
         """
         手のランドマークデータを処理
+
+        Args:
+            landmarks: 手のランドマークの (21, 3) 配列
+            timestamp: フレーム取得時のtime.monotonic()
         """
         try:
-            landmark_9 = landmarks.landmark[9]
-            timestamp = time.time()
-            
-            if hand_id not in self.hand_trajectory_data:
-                self.hand_trajectory_data[hand_id] = {
-                    'timestamp': [],
-                    'x': [],
-                    'y': [],
-                    'z': []
-                }
+            x, y, z = landmarks[9].tolist()
+            
+            data = self.hand_trajectory_data.get(hand_id)
+            if data is None:
+                data = {field: np.empty(HAND_TRAJECTORY_CAPACITY, dtype=np.float64)
+                        for field in HAND_TRAJECTORY_FIELDS}
+                data['count'] = 0
+                self.hand_trajectory_data[hand_id] = data
+            
+            # 容量が足りなければ倍に拡張
+            count = data['count']
+            if count == len(data['timestamp']):
+                for field in HAND_TRAJECTORY_FIELDS:
+                    data[field] = np.resize(data[field], count * 2)
             
-            self.hand_trajectory_data[hand_id]['timestamp'].append(timestamp)
-            self.hand_trajectory_data[hand_id]['x'].append(landmark_9.x)
-            self.hand_trajectory_data[hand_id]['y'].append(landmark_9.y)
-            self.hand_trajectory_data[hand_id]['z'].append(landmark_9.z)
+            data['timestamp'][count] = timestamp
+            data['x'][count] = x
+            data['y'][count] = y
+            data['z'][count] = z
+            data['count'] = count + 1
         except Exception as e:
             logger.error(f"手のデータ処理中にエラー: {e}")
 
@@ -417,98 +901,35 @@ class DualCameraHandFaceSoundTracker:
 
     def _create_3d_trajectory_animation(self):
         """
-        手の軌跡の3Dアニメーションを作成して保存
+        手の軌跡の3Dアニメーションを別プロセスで作成して保存
+        描画に時間がかかるため、終了処理を待たせないようにバックグラウンドで実行する
         """
         if not self.hand_trajectory_data:
             logger.warning("手の軌跡データがありません")
             return
 
         try:
-            # データを単純な配列に変換
-            timestamps = []
-            x_coords = []
-            y_coords = []
-            z_coords = []
-            
-            for data in self.hand_trajectory_data.values():
-                timestamps.extend(data['timestamp'])
-                x_coords.extend(data['x'])
-                y_coords.extend(data['y'])
-                z_coords.extend(data['z'])
+            # 記録済みの範囲を手ごとに切り出して連結
+            timestamps, x_coords, y_coords, z_coords = (
+                np.concatenate([data[field][:data['count']]
+                                for data in self.hand_trajectory_data.values()])
+                for field in HAND_TRAJECTORY_FIELDS
+            )
 
             # データを時系列でソート
             sorted_indices = np.argsort(timestamps)
-            x_coords = np.array(x_coords)[sorted_indices]
-            y_coords = np.array(y_coords)[sorted_indices]
-            z_coords = np.array(z_coords)[sorted_indices]
-            timestamps = np.array(timestamps)[sorted_indices]
-
-            # 3Dプロットの設定
-            fig = plt.figure(figsize=(12, 8))
-            ax = fig.add_subplot(111, projection='3d')
-
-            # プロット用のラインとポイントを作成
-            line = ax.plot([], [], [], 
-                        c='blue',
-                        alpha=0.5,
-                        linewidth=2)[0]
-            point = ax.plot([], [], [],
-                        'o',
-                        c='red',
-                        markersize=8)[0]
-
-            margin = 0.1
-            ax.set_xlim([min(x_coords) - margin, max(x_coords) + margin])
-            ax.set_ylim([min(y_coords) - margin, max(y_coords) + margin])
-            ax.set_zlim([min(z_coords) - margin, max(z_coords) + margin])
-            
-            ax.set_xlabel('X')
-            ax.set_ylabel('Y')
-            ax.set_zlabel('Z')
-            ax.set_title('Hand Trajectory (3D)')
-            ax.grid(True)
-            
-            trail_length = 30
-
-            def update(frame):
-                ax.view_init(elev=20, azim=frame)
-                
-                start_idx = max(0, frame - trail_length)
-                end_idx = frame + 1
-                
-                if end_idx > len(x_coords):
-                    end_idx = len(x_coords)
-                    start_idx = max(0, end_idx - trail_length)
-                
-                # 軌跡の更新
-                line.set_data(x_coords[start_idx:end_idx],
-                            y_coords[start_idx:end_idx])
-                line.set_3d_properties(z_coords[start_idx:end_idx])
-                
-                # 現在位置の点の更新
-                if end_idx > 0:
-                    point.set_data([x_coords[end_idx-1]], 
-                                [y_coords[end_idx-1]])
-                    point.set_3d_properties([z_coords[end_idx-1]])
-                
-                return line, point
-
-            # アニメーションの作成と保存
-            num_frames = len(timestamps)
-            ani = animation.FuncAnimation(fig, 
-                                        update,
-                                        frames=num_frames,
-                                        interval=50,
-                                        blit=True)
+            x_coords = x_coords[sorted_indices]
+            y_coords = y_coords[sorted_indices]
+            z_coords = z_coords[sorted_indices]
 
             animation_path = self.session_dir / 'hand_trajectory_3d.mp4'
-            writer = animation.FFMpegWriter(fps=20,
-                                        metadata=dict(artist='HandTracker'),
-                                        bitrate=5000)
-            ani.save(str(animation_path), writer=writer)
-            
-            plt.close(fig)
-            logger.info(f"3Dアニメーションを保存しました: {animation_path}")
+            # 非デーモンプロセスなので、インタプリタは描画完了を待ってから終了する
+            render_process = multiprocessing.Process(
+                target=_render_3d_trajectory_animation,
+                args=(x_coords, y_coords, z_coords, str(animation_path))
+            )
+            render_process.start()
+            logger.info(f"3Dアニメーションをバックグラウンドで作成します: {animation_path}")
         except Exception as e:
             logger.error(f"3Dアニメーション作成中にエラー: {e}")
 
@@ -526,13 +947,16 @@ class DualCameraHandFaceSoundTracker:
                 
             # 手の軌跡データの保存
             if self.hand_trajectory_data:
-                dfs = []
-                for hand_id, data in self.hand_trajectory_data.items():
-                    df = pd.DataFrame(data)
-                    df['hand_id'] = hand_id
-                    dfs.append(df)
+                # 手ごとの記録済み範囲を列ごとに一度だけ連結し、1つのDataFrameにする
+                hands = list(self.hand_trajectory_data.items())
+                columns = {
+                    field: np.concatenate([data[field][:data['count']] for _, data in hands])
+                    for field in HAND_TRAJECTORY_FIELDS
+                }
+                columns['hand_id'] = np.repeat([hand_id for hand_id, _ in hands],
+                                               [data['count'] for _, data in hands])
                 
-                df_hands = pd.concat(dfs, ignore_index=True)
+                df_hands = pd.DataFrame(columns)
                 df_hands['relative_time'] = df_hands['timestamp'] - df_hands['timestamp'].min()
                 df_hands.to_csv(self.session_dir / 'hand_trajectories.csv', index=False)
             
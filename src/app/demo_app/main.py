@@ -18,7 +18,6 @@ class DemoApp(Application):
             # 処理スレッドを開始
             self.face_processor.start()
             self.hand_processor.start()
-            self.hand_processor2.start()
             self.hand_processor.sound_generator.play_rhythm()
             self.hand_processor.sound_generator.goal_point = Point(0.5, 0.5, 0.1)
 
@@ -37,32 +36,30 @@ class DemoApp(Application):
                 # フレームを処理キューに追加
                 try:
                     self.face_processor.put_to_queue(face_frame.copy())
-                    self.hand_processor.put_to_queue(hand_frame.copy())
-                    self.hand_processor2.put_to_queue(hand_frame2.copy())
+                    self.hand_processor.put_to_queue((hand_frame.copy(), hand_frame2.copy()))
                 except queue.Full:
                     continue
 
                 # 処理済みの結果を取得
                 try:
                     face_results, processed_face_frame = self.face_processor.get_from_queue()
-                    hand_results, processed_hand_frame = self.hand_processor.get_from_queue()
-                    hand_results2, processed_hand_frame2 = self.hand_processor2.get_from_queue()
+                    hand_result, hand_result2 = self.hand_processor.get_from_queue()
                 except queue.Empty:
                     continue
                 
                 face_image = processed_face_frame.copy()
-                hand_image = processed_hand_frame.copy()
-                hand_image2 = processed_hand_frame2.copy()
+                hand_image = hand_result.frame
+                hand_image2 = hand_result2.frame
                 
                 # 手のランドマーク処理
-                if hand_results['multi_hand_landmarks']:
-                    self.hand_processor.process_hand_landmarks2(hand_image, hand_results, hand_results2)
+                if hand_result.landmarks:
+                    self.hand_processor.process_hand_landmarks2(hand_image, hand_result, hand_result2)
                 else:
                     self.hand_processor.sound_generator.current_notes = None
 
                 # 手の縦方向ランドマーク処理
-                # if hand_results2['multi_hand_landmarks']:
-                #     self.hand_processor2.process_hand_landmarks(hand_image2, hand_results2)
+                # if hand_result2.landmarks:
+                #     self.hand_processor.process_hand_landmarks(hand_image2, hand_result2)
 
                 # 顔のランドマーク処理
                 if face_results['multi_face_landmarks']:
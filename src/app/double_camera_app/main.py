@@ -79,16 +79,16 @@ class Application:
                 # 処理済みの結果を取得
                 try:
                     face_results, processed_face_frame = self.face_processor.get_from_queue()
-                    hand_results, processed_hand_frame = self.hand_processor.get_from_queue()
+                    hand_result = self.hand_processor.get_from_queue()
                 except queue.Empty:
                     continue
                 
                 face_image = processed_face_frame.copy()
-                hand_image = processed_hand_frame.copy()
+                hand_image = hand_result.frame
                 
                 # 手のランドマーク処理
-                if hand_results['multi_hand_landmarks']:
-                    self.hand_processor.process_hand_landmarks(hand_image, hand_results)
+                if hand_result.landmarks:
+                    self.hand_processor.process_hand_landmarks(hand_image, hand_result)
                 
                 # 顔のランドマーク処理
                 if face_results['multi_face_landmarks']:
@@ -85,15 +85,15 @@ class Application:
 
                 # 処理済みの結果を取得
                 try:
-                    hand_results, processed_frame = self.hand_processor.get_from_queue()
+                    hand_result = self.hand_processor.get_from_queue()
                 except queue.Empty:
                     continue
 
-                processed_image = processed_frame.copy()
+                processed_image = hand_result.frame
                 
                 # 手のランドマーク処理
-                if hand_results['multi_hand_landmarks']:
-                    self.hand_processor.process_hand_landmarks(processed_image, hand_results)
+                if hand_result.landmarks:
+                    self.hand_processor.process_hand_landmarks(processed_image, hand_result)
                 else:
                     self.hand_processor.sound_generator.current_notes = None
                 
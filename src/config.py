@@ -5,6 +5,15 @@ class Settings(BaseSettings):
     face_camera_id: int
     hand_camera_1_id: int
     hand_camera_2_id: int
+    # 手の推論をMediaPipe Tasks APIのGPUデリゲートで行うか（使えない場合はCPUで実行）
+    use_gpu: bool = False
+    hand_model_path: str = "models/hand_landmarker.task"
+    # CPU版の手のランドマークモデル（0: 軽量版, 1: フル版）
+    hand_model_complexity: int = 1
+    # 推論前にフレームを縮小するか（ランドマークは正規化座標なので後段の処理は変わらない）
+    inference_downscale: bool = False
+    # ランドマークと座標などの文字を映像に描画するか（表示も録画もしない場合は無効にできる）
+    show_overlay: bool = True
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from typing import Any, List, Optional
+import numpy as np
+
+@dataclass(slots=True)
+class HandFrame:
+    """
+    1フレーム分の手の処理結果と、描画用の元フレーム
+    """
+    landmarks: Optional[List[Any]]   # 検出した手のNormalizedLandmarkList（検出なしはNone）
+    handedness: Optional[List[Any]]  # 手ごとの左右判定のClassificationList
+    frame: np.ndarray
@@ -81,12 +81,9 @@ class FaceProcessor:
                         image_rgb = cv2.cvtColor(frame_copy, cv2.COLOR_BGR2RGB)
                         face_results = face_mesh.process(image_rgb)
                         
+                        # process()は毎回新しい結果オブジェクトを返すのでコピーは不要
                         results = {
-                            'multi_face_landmarks': [
-                                landmark.copy() if hasattr(landmark, 'copy') 
-                                else landmark 
-                                for landmark in (face_results.multi_face_landmarks or [])
-                            ] if face_results.multi_face_landmarks else None
+                            'multi_face_landmarks': face_results.multi_face_landmarks
                         }
                         
                         self.face_result_queue.put((results, frame_copy))
@@ -2,18 +2,147 @@ import cv2
 import mediapipe as mp
 import threading
 import queue
+import collections
+import time
+import math
 import numpy as np
+from types import SimpleNamespace
 from loguru import logger
-from math import sqrt
 from src.utils.sound_generator import SoundGenerator
 from src.utils.data_recorder import DataRecorder
+from src.models.hand_frame import HandFrame
 from src.config import setting
 
+try:
+    from mediapipe.framework.formats import landmark_pb2, classification_pb2
+    from mediapipe.tasks.python import BaseOptions
+    from mediapipe.tasks.python.vision import HandLandmarker, HandLandmarkerOptions, RunningMode
+    HAS_MP_TASKS = True
+except ImportError:
+    HAS_MP_TASKS = False
+
+def _compute_z(x9, y9, x0, y0):
+    """
+    手首(0)から中指の付け根(9)までの距離を奥行きの目安に変換
+    """
+    d = math.sqrt((x9 - x0) ** 2 + (y9 - y0) ** 2) - 0.18
+    return max(0.0, d) * 2.0
+
+# 処理結果を保持する数（溜めても遅延が増えるだけなので最新の数件のみ）
+QUEUE_SIZE = 2
+
+# 手の検出・追跡の信頼度の閾値
+# 追跡の閾値を下げて前フレームの領域を使い続け、負荷の高い手のひら検出の実行回数を減らす
+MIN_DETECTION_CONFIDENCE = 0.7
+MIN_TRACKING_CONFIDENCE = 0.3
+
+# setting.inference_downscaleが有効なときの推論用フレームの長辺
+INFERENCE_LONG_SIDE = 640
+
+class GpuHands:
+    """
+    MediaPipe Tasks APIのHandLandmarkerをGPUデリゲートで動かし、
+    mp.solutions.hands.Handsと同じ形式の結果を返すラッパー
+    VIDEOモードでは前フレームの手の領域を追跡し、見失ったときだけ手のひら検出を行う
+    """
+    def __init__(self, model_path: str, max_num_hands: int, min_detection_confidence: float,
+                 min_tracking_confidence: float):
+        options = HandLandmarkerOptions(
+            base_options=BaseOptions(model_asset_path=model_path,
+                                     delegate=BaseOptions.Delegate.GPU),
+            running_mode=RunningMode.VIDEO,
+            num_hands=max_num_hands,
+            min_hand_detection_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence
+        )
+        self.landmarker = HandLandmarker.create_from_options(options)
+        self.last_timestamp_ms = -1
+    
+    def process(self, image_rgb):
+        # VIDEOモードではタイムスタンプが単調増加である必要がある
+        timestamp_ms = max(time.monotonic_ns() // 1_000_000, self.last_timestamp_ms + 1)
+        self.last_timestamp_ms = timestamp_ms
+        mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=image_rgb)
+        results = self.landmarker.detect_for_video(mp_image, timestamp_ms)
+        
+        # 描画・後段の処理がそのまま使えるようにprotoに変換
+        multi_hand_landmarks = [
+            landmark_pb2.NormalizedLandmarkList(landmark=[
+                landmark_pb2.NormalizedLandmark(x=lm.x, y=lm.y, z=lm.z)
+                for lm in landmarks
+            ])
+            for landmarks in results.hand_landmarks
+        ]
+        multi_handedness = [
+            classification_pb2.ClassificationList(classification=[
+                classification_pb2.Classification(index=c.index, score=c.score, label=c.category_name)
+                for c in categories
+            ])
+            for categories in results.handedness
+        ]
+        return SimpleNamespace(multi_hand_landmarks=multi_hand_landmarks or None,
+                               multi_handedness=multi_handedness or None)
+    
+    def close(self):
+        self.landmarker.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+class StatusOverlay:
+    """
+    状態表示の固定ラベル（"X: "など）を最初に1回だけ描画しておき、
+    毎フレームは描画済みのラベルを貼り付けて値の文字だけを描画する
+    """
+    def __init__(self, labels, origins, font_scale, color=(0, 255, 0), thickness=2):
+        self.font_scale = font_scale
+        self.color = color
+        self.thickness = thickness
+        
+        # 値はラベルの直後から描画する
+        self.value_origins = []
+        width = height = 0
+        for label, (x, y) in zip(labels, origins):
+            (label_width, _), baseline = cv2.getTextSize(
+                label, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)
+            self.value_origins.append((x + label_width, y))
+            width = max(width, x + label_width + thickness)
+            height = max(height, y + baseline + thickness)
+        
+        label_image = np.zeros((height, width), dtype=np.uint8)
+        for label, origin in zip(labels, origins):
+            cv2.putText(label_image, label, origin, cv2.FONT_HERSHEY_SIMPLEX,
+                        font_scale, 255, thickness, cv2.LINE_8)
+        self.mask = (label_image > 0)[..., None]
+        self.color_image = np.empty((height, width, 3), dtype=np.uint8)
+        self.color_image[:] = color
+    
+    def draw(self, image, values):
+        height = min(self.mask.shape[0], image.shape[0])
+        width = min(self.mask.shape[1], image.shape[1])
+        np.copyto(image[:height, :width], self.color_image[:height, :width],
+                  where=self.mask[:height, :width])
+        for value, origin in zip(values, self.value_origins):
+            cv2.putText(image, value, origin, cv2.FONT_HERSHEY_SIMPLEX,
+                        self.font_scale, self.color, self.thickness, cv2.LINE_8)
+
 class HandProcessor:
     """ 
     mediapipeで手の処理を行うクラス
     """
-    def __init__(self, data_recorder: DataRecorder):
+    def __init__(self, data_recorder: DataRecorder, num_cameras: int = 1):
+        """
+        Args:
+            data_recorder: 手の位置データの記録先
+            num_cameras: put_to_queue()にまとめて渡すカメラの台数
+                         1台なら最初の手しか使わないので検出する手は1つ
+                         複数台の場合は横に並べた1枚の画像で検出するため、検出数の上限を
+                         全カメラで分け合うことになる。1台に手が2つ映っても他のカメラの手を
+                         取りこぼさないよう、カメラ1台につき2つ分の上限を確保する
+        """
         # 音ジェネレーター設定
         try:
             output_names = SoundGenerator.get_output_names()
@@ -24,17 +153,36 @@ class HandProcessor:
             raise
         
         self.data_recorder = data_recorder
+        self.max_num_hands = 1 if num_cameras == 1 else 2 * num_cameras
+        
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=0.5
-        )
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
+        # 描画スタイルは毎フレーム作り直さず使い回す
+        self.landmarks_style = self.mp_drawing_styles.get_default_hand_landmarks_style()
+        self.connections_style = self.mp_drawing_styles.get_default_hand_connections_style()
+        # 状態表示（process_hand_landmarks用とprocess_hand_landmarks2用）
+        self.status_overlay = StatusOverlay(
+            ['Palm up: ', 'X: ', 'Y: ', 'Z: '],
+            [(10, 30), (10, 70), (10, 110), (10, 150)],
+            font_scale=1
+        )
+        self.status_overlay2 = StatusOverlay(
+            ['Palm up: ', 'X: ', 'Y: ', 'Z: ', 'sound_on: ', 'sound_changeable: '],
+            [(10, 20), (10, 40), (10, 60), (10, 80), (10, 100), (10, 120)],
+            font_scale=0.5
+        )
         
-        self.hand_frame_queue = queue.Queue(maxsize=10)
-        self.hand_result_queue = queue.Queue(maxsize=10)
+        self._combined_buf = None
+        self._small_buf = None
+        self._rgb_buf = None
+        # 処理待ちのフレームは最新の1枚だけを持つ（新しいフレームが来たら古いものは捨てる）
+        self.hand_frame_slot = None
+        self.hand_frame_ready = threading.Condition()
+        # 処理結果は処理スレッドだけが追加し、メインループだけが取り出す
+        # 一杯のときは一番古い結果が自動的に捨てられる
+        self.hand_results = collections.deque(maxlen=QUEUE_SIZE)
+        self.hand_result_ready = threading.Event()
         self.running = threading.Event()
         self.process_thread = threading.Thread(target=self.process_frame)
         self.process_thread.daemon = True
@@ -49,80 +197,200 @@ class HandProcessor:
         別スレッドでのmediapipe処理を終了し、キューをクリア
         """
         self.running.clear()
-        # キューをクリア
-        for q in [self.hand_frame_queue, self.hand_result_queue]:
-            while not q.empty():
-                try:
-                    q.get_nowait()
-                except queue.Empty:
-                    break
+        # 処理待ちのフレームを破棄し、待機中の処理スレッドを起こす
+        with self.hand_frame_ready:
+            self.hand_frame_slot = None
+            self.hand_frame_ready.notify()
+        self.hand_results.clear()
         self.process_thread.join(timeout=2.0)
         self.sound_generator.end()
                 
     def put_to_queue(self, frame):
-        self.hand_frame_queue.put(frame, timeout=0.1)
+        """
+        フレームを処理キューに追加
+        複数カメラのフレームをタプルで渡すと1回の推論でまとめて処理し、
+        get_from_queue()はカメラごとのHandFrameを同じ順のタプルで返す
+        """
+        # 処理が追いつかない場合は古いフレームを捨て、カメラ側を待たせない
+        with self.hand_frame_ready:
+            self.hand_frame_slot = frame
+            self.hand_frame_ready.notify()
 
     def get_from_queue(self):
-        hand_results, processed_hand_frame  = self.hand_result_queue.get(timeout=0.1)
-        return hand_results, processed_hand_frame 
+        """
+        一番古い処理結果をHandFrameで取り出す
+        0.1秒待っても結果がなければqueue.Emptyを送出する
+        """
+        while True:
+            try:
+                return self.hand_results.popleft()
+            except IndexError:
+                self.hand_result_ready.clear()
+                # clear()の直前に追加された結果を取りこぼさないよう確認してから待つ
+                if self.hand_results:
+                    continue
+                if not self.hand_result_ready.wait(timeout=0.1):
+                    raise queue.Empty
     
     def judge_palm_up(self, landmarks, handedness) -> bool:
         """
         手のひらの向きを計算
         
-        手のひらの法線ベクトルを計算し、上向きかどうかを判定
-        landmark[0]: 手首
-        landmark[5, 9, 13, 17]: 指の付け根
+        人差し指と小指の先の左右関係から、手のひらが上向きかどうかを判定
+        landmark[8]: 人差し指の先
+        landmark[20]: 小指の先
+        
+        Args:
+            landmarks: 手のランドマーク（NormalizedLandmarkList）
+            handedness: "Left" または "Right"
         """
         try:
-            if_left = (handedness == "Left")
-            # 人差し指の付け根
-            point5 = np.array([landmarks.landmark[5].x,
-                                  landmarks.landmark[5].y])
-            # 小指の付け根
-            point17 = np.array([landmarks.landmark[17].x,
-                                  landmarks.landmark[17].y])          
-            
-            is_palm_up = (landmarks.landmark[8].x < landmarks.landmark[20].x) if if_left else (landmarks.landmark[8].x > landmarks.landmark[20].x )
-            return is_palm_up
+            lm = landmarks.landmark
+            index_x = lm[8].x
+            pinky_x = lm[20].x
+            return index_x < pinky_x if handedness == "Left" else index_x > pinky_x
             
         except Exception as e:
             logger.error(f"手のひらの向き計算中にエラー: {e}")
             return False
         
+    def create_hands(self):
+        """
+        手の推論器を作成
+        setting.use_gpuが有効ならGPUデリゲートを使い、使えない場合はCPU版にフォールバック
+        """
+        if setting.use_gpu:
+            if HAS_MP_TASKS:
+                try:
+                    return GpuHands(setting.hand_model_path,
+                                    max_num_hands=self.max_num_hands,
+                                    min_detection_confidence=MIN_DETECTION_CONFIDENCE,
+                                    min_tracking_confidence=MIN_TRACKING_CONFIDENCE)
+                except Exception as e:
+                    logger.warning(f"GPUでの手の推論を初期化できないため、CPUで実行します: {e}")
+            else:
+                logger.warning("MediaPipe Tasks APIが使えないため、CPUで手の推論を実行します")
+        
+        return self.mp_hands.Hands(
+            static_image_mode=False,
+            model_complexity=setting.hand_model_complexity,
+            max_num_hands=self.max_num_hands,
+            min_detection_confidence=MIN_DETECTION_CONFIDENCE,
+            min_tracking_confidence=MIN_TRACKING_CONFIDENCE
+        )
+    
+    def to_inference_rgb(self, frame):
+        """
+        推論用のRGBフレームを作成
+        setting.inference_downscaleが有効なら長辺をINFERENCE_LONG_SIDEまで縮小してから色変換する
+        縮小・色変換の出力先は使い回す（フレームサイズが変わったときだけ確保し直す）
+        """
+        height, width = frame.shape[:2]
+        long_side = max(height, width)
+        if setting.inference_downscale and long_side > INFERENCE_LONG_SIDE:
+            scale = INFERENCE_LONG_SIDE / long_side
+            small_shape = (round(height * scale), round(width * scale), frame.shape[2])
+            if self._small_buf is None or self._small_buf.shape != small_shape:
+                self._small_buf = np.empty(small_shape, dtype=np.uint8)
+            frame = cv2.resize(frame, (small_shape[1], small_shape[0]), dst=self._small_buf,
+                               interpolation=cv2.INTER_AREA)
+        
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty(frame.shape, dtype=np.uint8)
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+    
+    def combine_frames(self, frames):
+        """
+        複数カメラのフレームを横に並べて1枚にする
+        高さが異なる場合は最初のフレームの高さに合わせて縮小・拡大する
+        結合先のバッファは使い回す（サイズが変わったときだけ確保し直す）
+        
+        Returns:
+            tuple: (結合したフレーム, 結合後の各フレームの幅)
+        """
+        height = frames[0].shape[0]
+        widths = [
+            f.shape[1] if f.shape[0] == height else round(f.shape[1] * height / f.shape[0])
+            for f in frames
+        ]
+        combined_shape = (height, sum(widths), frames[0].shape[2])
+        if self._combined_buf is None or self._combined_buf.shape != combined_shape:
+            self._combined_buf = np.empty(combined_shape, dtype=np.uint8)
+        
+        # 各フレームを結合先のバッファへ直接書き込む
+        x = 0
+        for f, width in zip(frames, widths):
+            if f.shape[0] != height:
+                f = cv2.resize(f, (width, height))
+            np.copyto(self._combined_buf[:, x:x + width], f)
+            x += width
+        return self._combined_buf, widths
+    
+    @staticmethod
+    def split_results(hands_results, frames, widths):
+        """
+        結合したフレームでの推論結果をカメラごとのHandFrameに分け、座標を各フレームの正規化座標に戻す
+        手の中心（landmark[9]）がどのフレームにあるかで振り分ける
+        """
+        total_width = sum(widths)
+        bounds = np.cumsum(widths) / total_width
+        split = [HandFrame(landmarks=[], handedness=[], frame=frame) for frame in frames]
+        
+        multi_hand_landmarks = hands_results.multi_hand_landmarks or []
+        handedness = hands_results.multi_handedness or [None] * len(multi_hand_landmarks)
+        for landmarks, hand_class in zip(multi_hand_landmarks, handedness):
+            i = min(int(np.searchsorted(bounds, landmarks.landmark[9].x, side='right')), len(widths) - 1)
+            offset = bounds[i - 1] if i > 0 else 0.0
+            scale = total_width / widths[i]
+            for lm in landmarks.landmark:
+                lm.x = (lm.x - offset) * scale
+                lm.z = lm.z * scale
+            split[i].landmarks.append(landmarks)
+            split[i].handedness.append(hand_class)
+        
+        for hand_frame in split:
+            if not hand_frame.landmarks:
+                hand_frame.landmarks = None
+                hand_frame.handedness = None
+        return tuple(split)
+    
     def process_frame(self):
         """
         別スレッドで手のMediaPipe処理を実行
         """
         try:
-            with self.mp_hands.Hands(
-                static_image_mode=False,
-                max_num_hands=2,
-                min_detection_confidence=0.5
-            ) as hands:
+            with self.create_hands() as hands:
                 while self.running.is_set():
                     try:
-                        frame = self.hand_frame_queue.get(timeout=1.0)
+                        # 新しいフレームが来るか終了が通知されるまで待つ
+                        with self.hand_frame_ready:
+                            self.hand_frame_ready.wait_for(
+                                lambda: self.hand_frame_slot is not None or not self.running.is_set())
+                            frame = self.hand_frame_slot
+                            self.hand_frame_slot = None
                         if frame is None:
-                            continue
+                            break
                         
-                        frame_copy = frame.copy()
-                        image_rgb = cv2.cvtColor(frame_copy, cv2.COLOR_BGR2RGB)
+                        # 複数カメラのフレームは横に並べて1回の推論で処理する
+                        if isinstance(frame, tuple):
+                            combined, widths = self.combine_frames(frame)
+                            image_rgb = self.to_inference_rgb(combined)
+                        else:
+                            image_rgb = self.to_inference_rgb(frame)
                         hands_results = hands.process(image_rgb)
                         
-                        results = {
-                            'multi_hand_landmarks': [
-                                landmark.copy() if hasattr(landmark, 'copy') 
-                                else landmark 
-                                for landmark in (hands_results.multi_hand_landmarks or [])
-                            ],
-                            'handedness': hands_results.multi_handedness
-                        }
+                        # process()は毎回新しい結果オブジェクトを返すのでコピーは不要
+                        # 呼び出し側はコピーしたフレームを渡すので、描画用にそのまま返す
+                        # （返したフレームはこのスレッドからは触らないので、受け取った側で直接描画してよい）
+                        if isinstance(frame, tuple):
+                            results = self.split_results(hands_results, frame, widths)
+                        else:
+                            results = HandFrame(landmarks=hands_results.multi_hand_landmarks,
+                                                handedness=hands_results.multi_handedness,
+                                                frame=frame)
+                        self.hand_results.append(results)
+                        self.hand_result_ready.set()
                         
-                        self.hand_result_queue.put((results, frame_copy))
-                        
-                    except queue.Empty:
-                        continue
                     except Exception as e:
                         logger.exception(f"{e}:手フレーム処理中にエラーが発生")
                         continue
@@ -137,27 +405,27 @@ class HandProcessor:
             image,
             landmarks,
             self.mp_hands.HAND_CONNECTIONS,
-            self.mp_drawing_styles.get_default_hand_landmarks_style(),
-            self.mp_drawing_styles.get_default_hand_connections_style()
+            self.landmarks_style,
+            self.connections_style
         )
         
-    def process_hand_landmarks(self, image, hand_results):
+    def process_hand_landmarks(self, image, hand_frame):
         """
         手のランドマークの処理と描画を行う
         """
         try:
-            for i, landmarks in enumerate(hand_results['multi_hand_landmarks']):
+            for i, landmarks in enumerate(hand_frame.landmarks):
                 # ランドマークの描画
-                self.draw_landmarks(image, landmarks)
+                if setting.show_overlay:
+                    self.draw_landmarks(image, landmarks)
                 
                 # サウンドジェネレーターの更新（最初の手のみ）
                 if i == 0 and self.sound_generator is not None:
-                    hand_x = landmarks.landmark[9].x
-                    hand_y = landmarks.landmark[9].y
-
-                    hand_z = sqrt((landmarks.landmark[9].x - landmarks.landmark[0].x)**2 + (landmarks.landmark[9].y -landmarks.landmark[0].y)**2) -0.18
-                    hand_z = max(0, hand_z) * 2
-                    handedness = hand_results['handedness'][0].classification[0].label
+                    # 必要な座標だけをPythonのfloatで取り出す
+                    lm = landmarks.landmark
+                    hand_x, hand_y = lm[9].x, lm[9].y
+                    hand_z = _compute_z(hand_x, hand_y, lm[0].x, lm[0].y)
+                    handedness = hand_frame.handedness[0].classification[0].label
                     
                     # 手のひらが上向きか判定
                     is_palm_up = self.judge_palm_up(landmarks, handedness)
@@ -168,42 +436,36 @@ class HandProcessor:
                     new_notes = self.sound_generator.new_notes(hand_x, hand_y, hand_z, is_palm_up)
                     self.sound_generator.update_notes(new_notes)
                     
-                    # Palm upの状態を表示
-                    cv2.putText(image, f'Palm up: {is_palm_up}', 
-                              (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-                    # x,y,z座標を縦に表示
-                    cv2.putText(image, f'X: {hand_x:.2f}', 
-                                (10, 70), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-                    cv2.putText(image, f'Y: {hand_y:.2f}', 
-                                (10, 110), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-                    cv2.putText(image, f'Z: {hand_z:.2f}', 
-                                (10, 150), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+                    if setting.show_overlay:
+                        # Palm upの状態とx,y,z座標を縦に表示
+                        self.status_overlay.draw(image, [
+                            f'{is_palm_up}', f'{hand_x:.2f}', f'{hand_y:.2f}', f'{hand_z:.2f}'
+                        ])
         except Exception as e:
                 logger.error(f"ハンドランドマーク処理中のエラー: {e}")
     
-    def process_hand_landmarks2(self, image, hand_results, hand_results2):
+    def process_hand_landmarks2(self, image, hand_frame, hand_frame2):
         """
         手のランドマークの処理と描画を行う
         ２つのカメラで奥行きも取得
         """
         try:            
-            for i, landmarks in enumerate(hand_results['multi_hand_landmarks']):
-                if hand_results2['multi_hand_landmarks']:
-                    hand_z = hand_results2['multi_hand_landmarks'][0].landmark[9].x
+            for i, landmarks in enumerate(hand_frame.landmarks):
+                if hand_frame2.landmarks:
+                    hand_z = hand_frame2.landmarks[0].landmark[9].x
                     hand_z = max((0.7-hand_z)*2, 0)
                 else:
                     hand_z =0.5
                 # ランドマークの描画
-                self.draw_landmarks(image, landmarks)
+                if setting.show_overlay:
+                    self.draw_landmarks(image, landmarks)
                 landmarks.landmark[9].z = hand_z
                 
                 # サウンドジェネレーターの更新（最初の手のみ）
                 if i == 0 and self.sound_generator is not None:
-                    hand_x = landmarks.landmark[9].x
-                    hand_y = landmarks.landmark[9].y
+                    hand_x, hand_y = landmarks.landmark[9].x, landmarks.landmark[9].y
 
-                    hand_z = hand_z
-                    handedness = hand_results['handedness'][0].classification[0].label
+                    handedness = hand_frame.handedness[0].classification[0].label
                     
                     # 手のひらが上向きか判定
                     is_palm_up = self.judge_palm_up(landmarks, handedness)
@@ -213,20 +475,12 @@ class HandProcessor:
                     new_notes = self.sound_generator.new_notes(hand_x, hand_y, hand_z, is_palm_up)
                     self.sound_generator.update_notes(new_notes)
                     
-                    # Palm upの状態を表示
-                    cv2.putText(image, f'Palm up: {is_palm_up}', 
-                              (10, 20), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-                    # x,y,z座標を縦に表示
-                    cv2.putText(image, f'X: {hand_x:.2f}', 
-                                (10, 40), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-                    cv2.putText(image, f'Y: {hand_y:.2f}', 
-                                (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-                    cv2.putText(image, f'Z: {hand_z:.2f}', 
-                                (10, 80), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-                    cv2.putText(image, f'sound_on: {self.sound_generator.is_active}', 
-                                (10, 100), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-                    cv2.putText(image, f'sound_changeable: {self.sound_generator.is_changeable}', 
-                                (10, 120), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+                    if setting.show_overlay:
+                        # Palm upの状態、x,y,z座標、音の状態を縦に表示
+                        self.status_overlay2.draw(image, [
+                            f'{is_palm_up}', f'{hand_x:.2f}', f'{hand_y:.2f}', f'{hand_z:.2f}',
+                            f'{self.sound_generator.is_active}', f'{self.sound_generator.is_changeable}'
+                        ])
                            
         except Exception as e:
             logger.error(f"ハンドランドマーク処理中のエラー: {e}")
\ No newline at end of file
@@ -0,0 +1,108 @@
+import os
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+# src.configは.envか環境変数が必要なので、テスト用の値を入れてから読み込む
+for key in ["midi_output_port", "face_camera_id", "hand_camera_1_id", "hand_camera_2_id"]:
+    os.environ.setdefault(key, "0")
+
+from src.utils.hand_processor import HandProcessor
+
+
+def make_hand(x9, z=0.1):
+    """
+    landmark[9]のx座標を指定した21点の手のランドマーク
+    """
+    points = [SimpleNamespace(x=x9, y=0.5, z=z) for _ in range(21)]
+    return SimpleNamespace(landmark=points)
+
+
+def make_results(hands):
+    return SimpleNamespace(
+        multi_hand_landmarks=hands or None,
+        multi_handedness=[f"hand{i}" for i in range(len(hands))] or None
+    )
+
+
+class TestCombineFrames(unittest.TestCase):
+    def setUp(self):
+        # 結合用バッファだけを使うので、カメラや音源は初期化しない
+        self.processor = HandProcessor.__new__(HandProcessor)
+        self.processor._combined_buf = None
+
+    def test_same_height_frames_are_placed_side_by_side(self):
+        left = np.full((4, 6, 3), 1, dtype=np.uint8)
+        right = np.full((4, 2, 3), 2, dtype=np.uint8)
+
+        combined, widths = self.processor.combine_frames((left, right))
+
+        self.assertEqual(widths, [6, 2])
+        self.assertEqual(combined.shape, (4, 8, 3))
+        self.assertTrue((combined[:, :6] == 1).all())
+        self.assertTrue((combined[:, 6:] == 2).all())
+
+    def test_taller_frame_is_resized_to_first_height(self):
+        left = np.zeros((4, 6, 3), dtype=np.uint8)
+        right = np.zeros((8, 4, 3), dtype=np.uint8)
+
+        combined, widths = self.processor.combine_frames((left, right))
+
+        self.assertEqual(widths, [6, 2])
+        self.assertEqual(combined.shape, (4, 8, 3))
+
+    def test_buffer_is_reused_for_same_size(self):
+        frames = (np.zeros((4, 6, 3), dtype=np.uint8), np.zeros((4, 6, 3), dtype=np.uint8))
+
+        first, _ = self.processor.combine_frames(frames)
+        second, _ = self.processor.combine_frames(frames)
+
+        self.assertIs(first, second)
+
+
+class TestSplitResults(unittest.TestCase):
+    def setUp(self):
+        self.frames = ("frame1", "frame2")
+
+    def test_hands_are_remapped_to_their_camera(self):
+        results = make_results([make_hand(0.25, z=0.1), make_hand(0.75, z=0.2)])
+
+        cam1, cam2 = HandProcessor.split_results(results, self.frames, [640, 640])
+
+        self.assertEqual(cam1.frame, "frame1")
+        self.assertEqual(cam2.frame, "frame2")
+        self.assertAlmostEqual(cam1.landmarks[0].landmark[9].x, 0.5)
+        self.assertAlmostEqual(cam1.landmarks[0].landmark[9].z, 0.2)
+        self.assertAlmostEqual(cam2.landmarks[0].landmark[9].x, 0.5)
+        self.assertAlmostEqual(cam2.landmarks[0].landmark[9].z, 0.4)
+        self.assertEqual(cam1.handedness, ["hand0"])
+        self.assertEqual(cam2.handedness, ["hand1"])
+
+    def test_hand_on_boundary_goes_to_right_camera(self):
+        results = make_results([make_hand(0.5)])
+
+        cam1, cam2 = HandProcessor.split_results(results, self.frames, [640, 640])
+
+        self.assertIsNone(cam1.landmarks)
+        self.assertAlmostEqual(cam2.landmarks[0].landmark[9].x, 0.0)
+
+    def test_unequal_widths(self):
+        results = make_results([make_hand(0.8, z=0.1)])
+
+        cam1, cam2 = HandProcessor.split_results(results, self.frames, [640, 320])
+
+        self.assertIsNone(cam1.landmarks)
+        self.assertAlmostEqual(cam2.landmarks[0].landmark[9].x, (0.8 - 2 / 3) * 3)
+        self.assertAlmostEqual(cam2.landmarks[0].landmark[9].z, 0.3)
+
+    def test_no_hands(self):
+        cam1, cam2 = HandProcessor.split_results(make_results([]), self.frames, [640, 640])
+
+        for camera in (cam1, cam2):
+            self.assertIsNone(camera.landmarks)
+            self.assertIsNone(camera.handedness)
+
+
+if __name__ == "__main__":
+    unittest.main()